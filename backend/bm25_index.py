@@ -0,0 +1,61 @@
+"""
+bm25_index.py - Keyword (BM25) index over the stored Q&A documents.
+
+Dense MiniLM retrieval underperforms on keyword-heavy questions such as
+"ReleaseA critical defects count".  ingest() builds a BM25Okapi index over the
+same documents written to ChromaDB and pickles it next to the database; /query
+blends its scores with the dense cosine scores (see main._hybrid_search).
+"""
+
+import pickle
+import re
+from pathlib import Path
+
+from langchain_core.documents import Document
+from rank_bm25 import BM25Okapi
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _matches(metadata: dict, where: dict | None) -> bool:
+    """Evaluate the subset of Chroma `where` syntax that /query produces."""
+    if not where:
+        return True
+    if "$and" in where:
+        return all(_matches(metadata, clause) for clause in where["$and"])
+    return all(metadata.get(key) == value for key, value in where.items())
+
+
+class BM25Index:
+    def __init__(self, docs: list[Document]):
+        self.docs = docs
+        self._bm25 = BM25Okapi([tokenize(d.page_content) for d in docs]) if docs else None
+
+    def search(self, query: str, k: int, where: dict | None = None) -> list[tuple[Document, float]]:
+        """Top-k (document, max-normalized BM25 score) pairs passing the filter."""
+        if self._bm25 is None:
+            return []
+        scores = self._bm25.get_scores(tokenize(query))
+        ranked = sorted(
+            (i for i, d in enumerate(self.docs) if _matches(d.metadata, where)),
+            key=lambda i: scores[i], reverse=True,
+        )[:k]
+        top = max((scores[i] for i in ranked), default=0.0)
+        if top <= 0:
+            return []
+        return [(self.docs[i], float(scores[i] / top)) for i in ranked if scores[i] > 0]
+
+    def save(self, path: Path) -> None:
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: Path) -> "BM25Index | None":
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
@@ -1,6 +1,9 @@
 """
 debug_query.py - Inspect what ChromaDB retrieves and what context is sent to the LLM.
 
+Shows the dense (ChromaDB) candidates with their cosine distances.  For the
+final hybrid BM25 + dense ranking that /query uses, call GET /debug?q=... .
+
 Usage:
     python debug_query.py "What are the major defect categories?"
     python debug_query.py "What are the major defect categories?" --release ReleaseA
@@ -12,19 +15,19 @@ import os
 from pathlib import Path
 
 from dotenv import load_dotenv
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import Chroma
 
+from embeddings import get_embeddings
+
 load_dotenv()
 
 CHROMA_DIR = Path(__file__).parent / "chroma_db"
 COLLECTION_NAME = "qa_documents"
-EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
 SEPARATOR = "-" * 70
 
 
-def debug_query(question: str, release: str = None, doc_type: str = None, k: int = 8):
+def debug_query(question: str, release: str = None, doc_type: str = None, k: int = 5):
     # --- Load vectorstore ---
     if not CHROMA_DIR.exists():
         print("ERROR: ChromaDB not found. Run python ingest.py first.")
@@ -39,10 +42,9 @@ def debug_query(question: str, release: str = None, doc_type: str = None, k: int
     print(f"  k        : {k}")
     print(f"{'='*70}\n")
 
-    embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
     vectorstore = Chroma(
         collection_name=COLLECTION_NAME,
-        embedding_function=embeddings,
+        embedding_function=get_embeddings(),
         persist_directory=str(CHROMA_DIR),
     )
 
@@ -102,7 +104,7 @@ if __name__ == "__main__":
     parser.add_argument("question", help="The question to retrieve context for")
     parser.add_argument("--release", default=None, help="Filter by release: ReleaseA or ReleaseB")
     parser.add_argument("--doc_type", default=None, help="Filter by doc_type: defect, test_execution, metadata")
-    parser.add_argument("--k", type=int, default=8, help="Number of documents to retrieve")
+    parser.add_argument("--k", type=int, default=5, help="Number of documents to retrieve")
     args = parser.parse_args()
 
     debug_query(args.question, args.release, args.doc_type, args.k)
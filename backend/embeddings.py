@@ -0,0 +1,36 @@
+"""
+embeddings.py - Process-wide MiniLM embedding model shared by ingest and the API.
+
+Loading the SentenceTransformer weights takes seconds, so the model is created
+once on first use and reused by ingest(), the FastAPI server and the watchdog
+re-ingest path.
+"""
+
+import logging
+from functools import lru_cache
+
+import torch
+from langchain_community.embeddings import HuggingFaceEmbeddings
+
+logger = logging.getLogger("rag")
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+
+
+@lru_cache(maxsize=1)
+def get_embeddings() -> HuggingFaceEmbeddings:
+    """Load MiniLM on the GPU in FP16 when available, otherwise CPU FP32."""
+    logger.info("Loading embedding model: %s (%s)", EMBEDDING_MODEL, EMBEDDING_DEVICE)
+    embeddings = HuggingFaceEmbeddings(
+        model_name=EMBEDDING_MODEL,
+        model_kwargs={"device": EMBEDDING_DEVICE},
+        encode_kwargs={
+            "batch_size": 128,
+            "normalize_embeddings": True,
+            "convert_to_numpy": True,
+        },
+    )
+    if EMBEDDING_DEVICE == "cuda":
+        embeddings.client.half()
+    return embeddings
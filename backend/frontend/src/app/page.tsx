@@ -13,7 +13,7 @@ export default function Home() {
   const [filters, setFilters] = useState({
     release: "All releases",
     docType: "All types",
-    k: 8,
+    k: 5,
   });
 
   const handleFilterChange = (field: string, value: string | number) => {
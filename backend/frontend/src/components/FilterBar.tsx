@@ -50,7 +50,7 @@ export default function FilterBar({ release, docType, k, onChange }: Props) {
           min={1}
           max={20}
           value={k}
-          onChange={(e) => onChange("k", parseInt(e.target.value) || 8)}
+          onChange={(e) => onChange("k", parseInt(e.target.value) || 5)}
           className="w-16 rounded border border-gray-300 px-2 py-1.5 text-sm focus:outline-none focus:ring-2 focus:ring-blue-500"
         />
       </div>
@@ -23,13 +23,20 @@ Three passes are made:
 Usage
 -----
     python ingest.py
+    python ingest.py --refresh    # ignore cached Q&A pairs and regenerate all
 """
 
-import json
+import argparse
+import hashlib
+import logging
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import chromadb
 import groq as groq_sdk
+import numpy as np
+import orjson
 import pandas as pd
 from dotenv import load_dotenv
 from langchain_community.embeddings import HuggingFaceEmbeddings
@@ -37,44 +44,97 @@ from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 from pathlib import Path
 
+from bm25_index import BM25Index
+from embeddings import get_embeddings
+
 load_dotenv()
 
+logger = logging.getLogger("rag")
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 DOCS_DIR = Path(__file__).parent.parent / "docs"
 CHROMA_DIR = Path(__file__).parent / "chroma_db"
+BM25_PATH = Path(__file__).parent / "bm25_index.pkl"
+QA_CACHE_DIR = Path(__file__).parent / "qa_cache"
 COLLECTION_NAME = "qa_documents"
-EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 ANALYSIS_MODEL = "llama-3.3-70b-versatile"   # Groq free tier — fast + capable
+ENCODE_BATCH_SIZE = 256                       # SentenceTransformer.encode batch at ingest
+WRITE_BATCH_SIZE = 200                        # Chroma recommends 100–250 per add()
+
+# MiniLM is trained for cosine similarity (embeddings are normalized at encode
+# time); a denser graph and wider search beam buy recall for a few ms.
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:search_ef": 64,
+}
+
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+
+def configure_logging() -> None:
+    """Route the "rag" logger to stderr; level comes from LOG_LEVEL (default INFO)."""
+    logging.basicConfig(
+        handlers=[logging.StreamHandler()],
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+# ---------------------------------------------------------------------------
+# Vector store
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def get_chroma_client() -> chromadb.ClientAPI:
+    """Single persistent Chroma client shared by ingest() and the API server."""
+    return chromadb.PersistentClient(path=str(CHROMA_DIR))
 
 # ---------------------------------------------------------------------------
 # Data helpers — turn DataFrames into rich text for the LLM prompt
 # ---------------------------------------------------------------------------
 
 def df_to_markdown(df: pd.DataFrame, max_rows: int = 60) -> str:
-    """Return a markdown table. Truncate only if truly necessary."""
-    return df.head(max_rows).to_markdown(index=False)
+    """Return a markdown table. Truncate only if truly necessary.
+
+    Built with vectorized string ops rather than tabulate — the output only
+    feeds an LLM prompt, so column alignment padding is unnecessary.
+    """
+    d = df.head(max_rows).map(str)   # map(str) keeps blank cells as "nan" text
+    header = "| " + " | ".join(map(str, d.columns)) + " |"
+    sep = "|" + "|".join(["---"] * len(d.columns)) + "|"
+    rows = d.agg(" | ".join, axis=1).radd("| ").add(" |") if len(d) else []
+    return "\n".join([header, sep, *rows])
+
+
+def _value_counts(df: pd.DataFrame, cols: list[str]) -> dict[str, pd.Series]:
+    """One value_counts pass per column; callers reuse the Series they need."""
+    return {col: df[col].value_counts() for col in cols}
 
 
 def defect_stats(df: pd.DataFrame) -> str:
     lines = [f"Total defects: {len(df)}"]
-    for col in ["Component", "Severity", "Priority", "Status"]:
-        counts = df[col].value_counts()
-        lines.append(f"{col}: " + ", ".join(f"{k} ({v})" for k, v in counts.items()))
-    open_n = (df["Status"] != "Closed").sum()
-    closed_n = (df["Status"] == "Closed").sum()
+    counts = _value_counts(df, ["Component", "Severity", "Priority", "Status"])
+    for col, col_counts in counts.items():
+        lines.append(f"{col}: " + ", ".join(f"{k} ({v})" for k, v in col_counts.items()))
+    # Derive open/closed from the Status counts instead of re-scanning the column
+    closed_n = int(counts["Status"].get("Closed", 0))
+    open_n = len(df) - closed_n
     lines.append(f"Open: {open_n}  |  Closed: {closed_n}")
-    lines.append(f"Date range: {df['Created Date'].min().date()} → {df['Created Date'].max().date()}")
+    first, last = df["Created Date"].agg(["min", "max"])
+    lines.append(f"Date range: {first.date()} → {last.date()}")
     return "\n".join(lines)
 
 
 def test_stats(df: pd.DataFrame) -> str:
     lines = [f"Total test runs: {len(df)}"]
-    for col in ["Suite", "Status", "Tester", "Automation"]:
-        counts = df[col].value_counts()
-        lines.append(f"{col}: " + ", ".join(f"{k} ({v})" for k, v in counts.items()))
+    counts = _value_counts(df, ["Suite", "Status", "Tester", "Automation"])
+    for col, col_counts in counts.items():
+        lines.append(f"{col}: " + ", ".join(f"{k} ({v})" for k, v in col_counts.items()))
     linked = df["Linked Defect ID"].notna().sum()
     lines.append(f"Runs linked to a defect: {linked}  |  No linked defect: {len(df) - linked}")
     return "\n".join(lines)
@@ -94,47 +154,92 @@ def metadata_text(df: pd.DataFrame) -> str:
 _SYSTEM = (
     "You are a QA analyst assistant. "
     "Generate comprehensive, accurate question-and-answer pairs from the provided data. "
-    "Return ONLY a valid JSON array — no markdown fences, no commentary:\n"
-    '[{"question": "...", "answer": "..."}, ...]'
+    "Return ONLY a valid JSON object — no markdown fences, no commentary:\n"
+    '{"pairs": [{"question": "...", "answer": "..."}, ...]}'
 )
 
 def _call_llm(client: groq_sdk.Groq, user_prompt: str) -> list[dict]:
-    """Call Groq and return parsed list of {question, answer} dicts."""
-    msg = client.chat.completions.create(
-        model=ANALYSIS_MODEL,
-        max_tokens=4096,
-        messages=[
-            {"role": "system", "content": _SYSTEM},
-            {"role": "user", "content": user_prompt},
-        ],
-    )
-    raw = msg.choices[0].message.content.strip()
-    # Robustly extract the JSON array even if model adds surrounding text
-    start, end = raw.find("["), raw.rfind("]") + 1
-    if start == -1 or end == 0:
-        print("    [warn] Could not locate JSON array in LLM response — skipping.")
+    """Call Groq in JSON mode and return parsed list of {question, answer} dicts."""
+    try:
+        msg = client.chat.completions.create(
+            model=ANALYSIS_MODEL,
+            max_tokens=4096,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _SYSTEM},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+    except groq_sdk.BadRequestError as exc:
+        # JSON mode rejects invalid / truncated output with HTTP 400
+        logger.warning("LLM did not return valid JSON (%s) — skipping.", exc)
         return []
-    return json.loads(raw[start:end])
+    try:
+        parsed = orjson.loads(msg.choices[0].message.content)
+    except orjson.JSONDecodeError:
+        logger.warning("LLM response is not valid JSON — skipping.")
+        return []
+    pairs = parsed.get("pairs") if isinstance(parsed, dict) else None
+    if not isinstance(pairs, list):
+        logger.warning("No \"pairs\" array in LLM response — skipping.")
+        return []
+    return pairs
+
+
+def _qa_cache_key(user_prompt: str) -> str:
+    return hashlib.sha256(
+        "\0".join([ANALYSIS_MODEL, _SYSTEM, user_prompt]).encode()
+    ).hexdigest()
+
+
+def _cached_call_llm(client: groq_sdk.Groq, user_prompt: str,
+                     refresh: bool = False) -> list[dict]:
+    """_call_llm, re-using pairs generated earlier for an identical prompt.
+
+    The prompt embeds the file's data and statistics, so hashing it (with the
+    system prompt and model) changes whenever the source workbook or the prompt
+    template does — unchanged files skip the Groq round-trip on re-ingest.
+    `refresh` ignores any cached entry and overwrites it.
+    """
+    path = QA_CACHE_DIR / f"{_qa_cache_key(user_prompt)}.json"
+    if path.exists() and not refresh:
+        return orjson.loads(path.read_bytes())
+
+    pairs = _call_llm(client, user_prompt)
+    if pairs:
+        QA_CACHE_DIR.mkdir(exist_ok=True)
+        path.write_bytes(orjson.dumps(pairs))
+    return pairs
+
+
+def _prune_qa_cache(keep: set[str]) -> None:
+    """Delete cached pairs whose prompt was not part of the latest ingest."""
+    if not QA_CACHE_DIR.exists():
+        return
+    for path in QA_CACHE_DIR.glob("*.json"):
+        if path.stem not in keep:
+            path.unlink(missing_ok=True)
 
 
 def pairs_to_documents(pairs: list[dict], metadata: dict) -> list[Document]:
-    docs = []
-    for pair in pairs:
-        q = pair.get("question", "").strip()
-        a = pair.get("answer", "").strip()
-        if q and a:
-            docs.append(Document(
-                page_content=f"Q: {q}\nA: {a}",
-                metadata={**metadata, "question": q},
-            ))
-    return docs
+    return [
+        Document(page_content=f"Q: {q}\nA: {a}", metadata={**metadata, "question": q})
+        for pair in pairs
+        if (q := (pair.get("question") or "").strip())
+        and (a := (pair.get("answer") or "").strip())
+    ]
 
 # ---------------------------------------------------------------------------
 # Per-file Q&A generation prompts
+#
+# Each builder returns a (prompt, metadata) job; ingest() runs all jobs
+# against Groq concurrently since the stage is network-latency bound.
 # ---------------------------------------------------------------------------
 
-def qa_for_defects(client: groq_sdk.Groq, df: pd.DataFrame,
-                   release: str, filename: str) -> list[Document]:
+QAJob = tuple[str, dict]
+
+
+def qa_for_defects(df: pd.DataFrame, stats: str, release: str, filename: str) -> QAJob:
     prompt = f"""
 You are analyzing defect tracking data for {release} from {filename}.
 
@@ -142,7 +247,7 @@ You are analyzing defect tracking data for {release} from {filename}.
 {df_to_markdown(df)}
 
 === COMPUTED STATISTICS ===
-{defect_stats(df)}
+{stats}
 
 Generate ALL questions a user might reasonably ask about this defect data.
 Cover every angle:
@@ -159,17 +264,12 @@ Cover every angle:
 Provide precise, data-backed answers.
 """.strip()
 
-    print(f"    Generating defect Q&A pairs for {release} ...")
-    pairs = _call_llm(client, prompt)
-    docs = pairs_to_documents(pairs, {
+    return prompt, {
         "source": filename, "doc_type": "defect", "release": release,
-    })
-    print(f"    -> {len(docs)} pairs")
-    return docs
+    }
 
 
-def qa_for_tests(client: groq_sdk.Groq, df: pd.DataFrame,
-                 release: str, filename: str) -> list[Document]:
+def qa_for_tests(df: pd.DataFrame, stats: str, release: str, filename: str) -> QAJob:
     prompt = f"""
 You are analyzing test execution data for {release} from {filename}.
 
@@ -177,7 +277,7 @@ You are analyzing test execution data for {release} from {filename}.
 {df_to_markdown(df)}
 
 === COMPUTED STATISTICS ===
-{test_stats(df)}
+{stats}
 
 Generate ALL questions a user might reasonably ask about this test execution data.
 Cover every angle:
@@ -195,22 +295,17 @@ Cover every angle:
 Provide precise, data-backed answers.
 """.strip()
 
-    print(f"    Generating test execution Q&A pairs for {release} ...")
-    pairs = _call_llm(client, prompt)
-    docs = pairs_to_documents(pairs, {
+    return prompt, {
         "source": filename, "doc_type": "test_execution", "release": release,
-    })
-    print(f"    -> {len(docs)} pairs")
-    return docs
+    }
 
 
-def qa_for_metadata(client: groq_sdk.Groq, df: pd.DataFrame,
-                    release: str, filename: str) -> list[Document]:
+def qa_for_metadata(meta: str, release: str, filename: str) -> QAJob:
     prompt = f"""
 You are analyzing release metadata for {release} from {filename}.
 
 === METADATA ===
-{metadata_text(df)}
+{meta}
 
 Generate ALL questions a user might ask about this release's metadata and
 general information. Cover release name, dates, team size, scope, goals,
@@ -219,43 +314,36 @@ and any other metrics present.
 Provide precise answers.
 """.strip()
 
-    print(f"    Generating metadata Q&A pairs for {release} ...")
-    pairs = _call_llm(client, prompt)
-    docs = pairs_to_documents(pairs, {
+    return prompt, {
         "source": filename, "doc_type": "metadata", "release": release,
-    })
-    print(f"    -> {len(docs)} pairs")
-    return docs
+    }
 
 # ---------------------------------------------------------------------------
 # Cross-release comparison Q&A
 # ---------------------------------------------------------------------------
 
-def qa_cross_release(
-    client: groq_sdk.Groq,
-    defects_a: pd.DataFrame, tests_a: pd.DataFrame, meta_a: pd.DataFrame,
-    defects_b: pd.DataFrame, tests_b: pd.DataFrame, meta_b: pd.DataFrame,
-) -> list[Document]:
+def qa_cross_release(stats: dict[str, str]) -> QAJob:
+    """`stats` holds the text blocks already built for the per-file prompts."""
     prompt = f"""
 You are comparing two software releases: Release A and Release B.
 
 === RELEASE A — DEFECT STATISTICS ===
-{defect_stats(defects_a)}
+{stats['defects_a']}
 
 === RELEASE B — DEFECT STATISTICS ===
-{defect_stats(defects_b)}
+{stats['defects_b']}
 
 === RELEASE A — TEST EXECUTION STATISTICS ===
-{test_stats(tests_a)}
+{stats['tests_a']}
 
 === RELEASE B — TEST EXECUTION STATISTICS ===
-{test_stats(tests_b)}
+{stats['tests_b']}
 
 === RELEASE A — METADATA ===
-{metadata_text(meta_a)}
+{stats['meta_a']}
 
 === RELEASE B — METADATA ===
-{metadata_text(meta_b)}
+{stats['meta_b']}
 
 Generate ALL cross-release comparison questions a user might ask.
 Cover every angle:
@@ -273,83 +361,158 @@ Cover every angle:
 Provide precise, data-backed answers referencing both releases.
 """.strip()
 
-    print("    Generating cross-release comparison Q&A pairs ...")
-    pairs = _call_llm(client, prompt)
-    docs = pairs_to_documents(pairs, {
+    return prompt, {
         "source": "cross_release",
         "doc_type": "comparison",
         "release": "all",
-    })
-    print(f"    -> {len(docs)} pairs")
-    return docs
+    }
 
 # ---------------------------------------------------------------------------
 # Main ingestion orchestrator
 # ---------------------------------------------------------------------------
 
-def ingest() -> Chroma:
+# Low-cardinality columns are read as categoricals (faster value_counts, less
+# memory); dates are parsed once at load time.
+_DEFECT_READ_KWARGS = {
+    "dtype": {col: "category" for col in ["Component", "Severity", "Priority", "Status"]},
+    "parse_dates": ["Created Date"],
+}
+_TEST_READ_KWARGS = {
+    "dtype": {col: "category" for col in ["Suite", "Status", "Tester", "Automation"]},
+}
+
+
+def ingest(embeddings: HuggingFaceEmbeddings | None = None,
+           refresh: bool = False) -> Chroma:
+    """Generate Q&A pairs for all workbooks and rebuild the vector store.
+
+    refresh=True regenerates every prompt's pairs instead of using QA_CACHE_DIR.
+    """
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise RuntimeError("GROQ_API_KEY not set. Add it to backend/.env")
 
     client = groq_sdk.Groq(api_key=api_key)
 
-    print(f"Docs directory : {DOCS_DIR.resolve()}")
-    print(f"ChromaDB path  : {CHROMA_DIR.resolve()}")
-    print(f"Analysis model : {ANALYSIS_MODEL}\n")
+    logger.info("Docs directory : %s", DOCS_DIR.resolve())
+    logger.info("ChromaDB path  : %s", CHROMA_DIR.resolve())
+    logger.info("Analysis model : %s", ANALYSIS_MODEL)
 
     # --- Load all DataFrames up front ---
-    def load(name: str) -> tuple[pd.DataFrame, str]:
+    def load(name: str, **read_kwargs) -> tuple[pd.DataFrame, str]:
         matches = list(DOCS_DIR.glob(f"*{name}*.xlsx"))
         if not matches:
             raise FileNotFoundError(f"No file matching *{name}*.xlsx in {DOCS_DIR}")
-        return pd.read_excel(matches[0]), matches[0].name
+        return pd.read_excel(matches[0], engine="openpyxl", **read_kwargs), matches[0].name
 
-    (defects_a, fn_da) = load("ReleaseA_Defects")
-    (tests_a,   fn_ta) = load("ReleaseA_TestExecution")
+    (defects_a, fn_da) = load("ReleaseA_Defects", **_DEFECT_READ_KWARGS)
+    (tests_a,   fn_ta) = load("ReleaseA_TestExecution", **_TEST_READ_KWARGS)
     (meta_a,    fn_ma) = load("ReleaseA_Meta")
-    (defects_b, fn_db) = load("ReleaseB_Defects")
-    (tests_b,   fn_tb) = load("ReleaseB_TestExecution")
+    (defects_b, fn_db) = load("ReleaseB_Defects", **_DEFECT_READ_KWARGS)
+    (tests_b,   fn_tb) = load("ReleaseB_TestExecution", **_TEST_READ_KWARGS)
     (meta_b,    fn_mb) = load("ReleaseB_Meta")
 
-    all_docs: list[Document] = []
+    # --- Compute statistics once; shared by per-file and cross-release prompts ---
+    stats = {
+        "defects_a": defect_stats(defects_a),
+        "tests_a":   test_stats(tests_a),
+        "meta_a":    metadata_text(meta_a),
+        "defects_b": defect_stats(defects_b),
+        "tests_b":   test_stats(tests_b),
+        "meta_b":    metadata_text(meta_b),
+    }
+
+    jobs: list[QAJob] = [
+        # Pass 1: per-file Q&A
+        qa_for_defects(defects_a, stats["defects_a"], "ReleaseA", fn_da),
+        qa_for_tests(tests_a, stats["tests_a"], "ReleaseA", fn_ta),
+        qa_for_metadata(stats["meta_a"], "ReleaseA", fn_ma),
+        qa_for_defects(defects_b, stats["defects_b"], "ReleaseB", fn_db),
+        qa_for_tests(tests_b, stats["tests_b"], "ReleaseB", fn_tb),
+        qa_for_metadata(stats["meta_b"], "ReleaseB", fn_mb),
+        # Pass 2: cross-release comparison Q&A
+        qa_cross_release(stats),
+    ]
+
+    # --- Fire all Groq calls concurrently; total latency ~ slowest call ---
+    logger.info("Generating Q&A pairs (%d prompts in parallel) ...", len(jobs))
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        results = list(pool.map(lambda job: _cached_call_llm(client, job[0], refresh), jobs))
 
-    # --- Pass 1: per-file Q&A ---
-    print("Pass 1: per-file Q&A generation")
-    all_docs += qa_for_defects(client, defects_a, "ReleaseA", fn_da)
-    all_docs += qa_for_tests(client, tests_a, "ReleaseA", fn_ta)
-    all_docs += qa_for_metadata(client, meta_a, "ReleaseA", fn_ma)
-    all_docs += qa_for_defects(client, defects_b, "ReleaseB", fn_db)
-    all_docs += qa_for_tests(client, tests_b, "ReleaseB", fn_tb)
-    all_docs += qa_for_metadata(client, meta_b, "ReleaseB", fn_mb)
-
-    # --- Pass 2: cross-release comparison Q&A ---
-    print("\nPass 2: cross-release comparison Q&A generation")
-    all_docs += qa_cross_release(
-        client, defects_a, tests_a, meta_a, defects_b, tests_b, meta_b
+    all_docs: list[Document] = []
+    failed: list[str] = []
+    for (_, metadata), pairs in zip(jobs, results):
+        docs = pairs_to_documents(pairs, metadata)
+        logger.info("    %s (%s) -> %d pairs", metadata["source"], metadata["doc_type"], len(docs))
+        if not docs:
+            failed.append(f"{metadata['source']} ({metadata['doc_type']})")
+        all_docs += docs
+
+    # Never replace the live index with an empty or partial one (e.g. Groq outage)
+    if failed:
+        raise RuntimeError(
+            f"No Q&A pairs generated for {', '.join(failed)} — existing ChromaDB left untouched."
+        )
+
+    logger.info("Total Q&A documents generated: %d", len(all_docs))
+
+    embeddings = embeddings or get_embeddings()
+
+    # Embed everything in one pass, calling the shared SentenceTransformer
+    # directly so batches are as full as possible
+    texts = [d.page_content for d in all_docs]
+    logger.info("Embedding %d documents ...", len(texts))
+    vectors = embeddings.client.encode(
+        texts,
+        batch_size=ENCODE_BATCH_SIZE,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        show_progress_bar=True,
+    ).astype(np.float32)
+
+    # --- Clear stale collection (keeps the shared client's SQLite handle open) ---
+    client_db = get_chroma_client()
+    existing = {getattr(c, "name", c) for c in client_db.list_collections()}
+    if COLLECTION_NAME in existing:
+        logger.info("Clearing existing ChromaDB collection ...")
+        client_db.delete_collection(COLLECTION_NAME)
+
+    # Write straight to the Chroma collection in batches, skipping the
+    # per-document LangChain insert path (one SQLite transaction per batch)
+    logger.info("Writing to ChromaDB ...")
+    collection = client_db.get_or_create_collection(
+        COLLECTION_NAME, metadata=HNSW_METADATA,
     )
-
-    print(f"\nTotal Q&A documents generated: {len(all_docs)}")
-
-    # --- Clear stale DB and re-embed ---
-    if CHROMA_DIR.exists():
-        print("Clearing existing ChromaDB ...")
-        shutil.rmtree(CHROMA_DIR)
-
-    print(f"Loading embedding model: {EMBEDDING_MODEL}")
-    embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
-
-    print("Writing to ChromaDB ...")
-    vectorstore = Chroma.from_documents(
-        documents=all_docs,
-        embedding=embeddings,
+    for start in range(0, len(all_docs), WRITE_BATCH_SIZE):
+        end = start + WRITE_BATCH_SIZE
+        collection.add(
+            ids=[f"doc-{i}" for i in range(start, min(end, len(all_docs)))],
+            embeddings=vectors[start:end].tolist(),
+            documents=texts[start:end],
+            metadatas=[d.metadata for d in all_docs[start:end]],
+        )
+
+    logger.info("Building BM25 keyword index ...")
+    BM25Index(all_docs).save(BM25_PATH)
+
+    vectorstore = Chroma(
+        client=client_db,
         collection_name=COLLECTION_NAME,
-        persist_directory=str(CHROMA_DIR),
+        embedding_function=embeddings,
     )
 
-    print(f"\nDone. {len(all_docs)} Q&A documents stored in collection '{COLLECTION_NAME}'.")
+    # Entries for prompts that no longer exist (edited workbooks) are dead weight
+    _prune_qa_cache({_qa_cache_key(prompt) for prompt, _ in jobs})
+
+    logger.info("Done. %d Q&A documents stored in collection '%s'.", len(all_docs), COLLECTION_NAME)
     return vectorstore
 
 
 if __name__ == "__main__":
-    ingest()
+    parser = argparse.ArgumentParser(description="Ingest QA Excel documents into ChromaDB")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Regenerate all Q&A pairs instead of using the on-disk cache")
+    args = parser.parse_args()
+
+    configure_logging()
+    ingest(refresh=args.refresh)
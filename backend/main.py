@@ -4,6 +4,7 @@ main.py - FastAPI RAG query API over QA Excel documents.
 Environment variables (put in backend/.env):
     GROQ_API_KEY       required for query answering
     ANTHROPIC_API_KEY  reserved for when Anthropic credits are available
+    LOG_LEVEL          optional, defaults to INFO
 
 Run:
     uvicorn main:app --reload
@@ -14,7 +15,11 @@ Drop any .xlsx file into the docs/ folder — the file watcher detects the
 change and re-ingests automatically.  Or call POST /ingest to trigger manually.
 """
 
+import asyncio
+import json
+import logging
 import os
+import re
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
@@ -30,62 +35,98 @@ from watchdog.observers import Observer
 from langchain_groq import ChatGroq
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import Chroma
+from langchain_core.documents import Document
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 
-from ingest import ingest, DOCS_DIR, CHROMA_DIR, COLLECTION_NAME, EMBEDDING_MODEL
+from bm25_index import BM25Index
+from embeddings import get_embeddings
+from ingest import (
+    ingest, configure_logging, get_chroma_client,
+    DOCS_DIR, CHROMA_DIR, BM25_PATH, COLLECTION_NAME,
+)
+from semantic_cache import SemanticCache
 
 load_dotenv()
+configure_logging()
+
+logger = logging.getLogger("rag")
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 LLM_MODEL = "llama-3.3-70b-versatile"
+DEBOUNCE_SECONDS = 2.0   # coalesce burst file-system events into one re-ingest
+
+# Hybrid retrieval: score = DENSE_WEIGHT * cosine + BM25_WEIGHT * normalized BM25
+DENSE_WEIGHT = 0.6
+BM25_WEIGHT = 0.4
+CANDIDATE_MULTIPLIER = 4   # each retriever contributes k * this candidates
+
+# Queries whose best dense match is farther than this (cosine distance) are
+# answered with NO_RELEVANT_ANSWER without calling the LLM.
+MAX_DISTANCE = 0.35
+NO_RELEVANT_ANSWER = "No relevant data was found in the QA documents for this question."
 
 # ---------------------------------------------------------------------------
 # Application state
 # ---------------------------------------------------------------------------
 
 vectorstore: Chroma | None = None
+bm25_index: BM25Index | None = None
 embeddings: HuggingFaceEmbeddings | None = None
 llm: ChatGroq | None = None
+query_cache = SemanticCache()
+_doc_count = 0   # refreshed when the collection is (re)opened, served by /health
+_cosine_space = False   # False for a legacy L2 collection awaiting re-ingest
 
 # Ensures only one ingestion runs at a time
 _ingest_lock = threading.Lock()
 _ingest_running = False
 _executor = ThreadPoolExecutor(max_workers=1)
+_search_pool = ThreadPoolExecutor(max_workers=4)
 
 
 # ---------------------------------------------------------------------------
 # Background ingestion
 # ---------------------------------------------------------------------------
 
-def _reload_vectorstore():
-    """Re-open ChromaDB after ingestion so the running server picks up new docs."""
-    global vectorstore
+def _open_vectorstore():
+    """(Re)open the collection on the shared client and refresh derived state."""
+    global vectorstore, bm25_index, _doc_count, _cosine_space
     vectorstore = Chroma(
+        client=get_chroma_client(),
         collection_name=COLLECTION_NAME,
         embedding_function=embeddings,
-        persist_directory=str(CHROMA_DIR),
     )
-    print(f"Vectorstore reloaded — {vectorstore._collection.count()} docs.")
+    _cosine_space = (vectorstore._collection.metadata or {}).get("hnsw:space") == "cosine"
+    # A pre-cosine (L2) collection predates the BM25 index; serve it dense-only
+    bm25_index = BM25Index.load(BM25_PATH) if _cosine_space else None
+    _doc_count = vectorstore._collection.count()
 
 
-def _run_ingest():
+def _reload_vectorstore():
+    """Re-open the collection after ingestion so the running server picks up new docs."""
+    _open_vectorstore()
+    query_cache.clear()
+    logger.info("Vectorstore reloaded — %d docs.", _doc_count)
+
+
+def _run_ingest(refresh: bool = False):
     """Run full ingestion pipeline in a background thread."""
     global _ingest_running
     if not _ingest_lock.acquire(blocking=False):
-        print("[ingest] Already in progress — skipping.")
+        logger.info("[ingest] Already in progress — skipping.")
         return
     _ingest_running = True
     try:
-        print("[ingest] Starting ingestion ...")
-        ingest()
+        logger.info("[ingest] Starting ingestion ...")
+        ingest(embeddings, refresh=refresh)
         _reload_vectorstore()
-        print("[ingest] Done.")
+        logger.info("[ingest] Done.")
     except Exception as exc:
-        print(f"[ingest] Failed: {exc}")
+        logger.exception("[ingest] Failed: %s", exc)
     finally:
         _ingest_running = False
         _ingest_lock.release()
@@ -96,12 +137,33 @@ def _run_ingest():
 # ---------------------------------------------------------------------------
 
 class DocsChangeHandler(FileSystemEventHandler):
-    """Trigger re-ingestion whenever an Excel file is added or modified."""
+    """Trigger re-ingestion whenever an Excel file is added or modified.
+
+    Excel emits several events per save (temp file, rename, modify), so events
+    are debounced: only the last one in a DEBOUNCE_SECONDS window queues ingestion.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._pending_timer: threading.Timer | None = None
+        self._timer_lock = threading.Lock()
 
     def _handle(self, event):
         if not event.is_directory and str(event.src_path).endswith(".xlsx"):
-            print(f"[watcher] Detected change: {event.src_path} — queuing ingestion.")
-            _executor.submit(_run_ingest)
+            logger.info("[watcher] Detected change: %s — queuing ingestion.", event.src_path)
+            with self._timer_lock:
+                if self._pending_timer is not None:
+                    self._pending_timer.cancel()
+                self._pending_timer = threading.Timer(
+                    DEBOUNCE_SECONDS, lambda: _executor.submit(_run_ingest)
+                )
+                self._pending_timer.daemon = True
+                self._pending_timer.start()
+
+    def cancel(self):
+        with self._timer_lock:
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
 
     def on_created(self, event):
         self._handle(event)
@@ -122,34 +184,49 @@ async def lifespan(app: FastAPI):
     if not api_key:
         raise RuntimeError("GROQ_API_KEY is not set. Add it to backend/.env")
 
-    print(f"Loading embedding model: {EMBEDDING_MODEL}")
-    embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+    embeddings = get_embeddings()
 
     if not CHROMA_DIR.exists():
-        print("ChromaDB not found — running initial ingestion ...")
-        ingest()
-
-    print(f"Connecting to ChromaDB at: {CHROMA_DIR.resolve()}")
-    vectorstore = Chroma(
-        collection_name=COLLECTION_NAME,
-        embedding_function=embeddings,
-        persist_directory=str(CHROMA_DIR),
-    )
-    print(f"Loaded {vectorstore._collection.count()} documents.")
+        logger.info("ChromaDB not found — running initial ingestion ...")
+        ingest(embeddings)
+
+    logger.info("Connecting to ChromaDB at: %s", CHROMA_DIR.resolve())
+    _open_vectorstore()
+
+    # A DB from before the cosine/HNSW + BM25 changes scores with L2 distance,
+    # which MAX_DISTANCE would misread — rebuild it once.  If that fails (Groq
+    # down, missing workbook) keep serving the old collection until /ingest works.
+    if not _cosine_space or bm25_index is None:
+        logger.info("Index is outdated (cosine=%s, BM25 index %s) — re-ingesting ...",
+                    _cosine_space, "present" if bm25_index is not None else "missing")
+        try:
+            ingest(embeddings)
+            _open_vectorstore()
+        except Exception as exc:
+            logger.warning("Re-ingestion failed (%s) — serving the existing collection "
+                           "dense-only until POST /ingest succeeds.", exc)
+
+    logger.info("Loaded %d documents.", _doc_count)
+    if bm25_index is None:
+        logger.warning("BM25 index not found — falling back to dense-only retrieval.")
 
     llm = ChatGroq(model=LLM_MODEL, api_key=api_key)
+    # Compose the answer chain once; /query reuses it for every request
+    app.state.chain = PROMPT | llm | StrOutputParser()
 
     # Start watching docs/ for new/changed files
     observer = Observer()
-    observer.schedule(DocsChangeHandler(), str(DOCS_DIR), recursive=False)
+    handler = DocsChangeHandler()
+    observer.schedule(handler, str(DOCS_DIR), recursive=False)
     observer.start()
-    print(f"Watching {DOCS_DIR} for new documents ...")
+    logger.info("Watching %s for new documents ...", DOCS_DIR)
 
-    print("API ready.")
+    logger.info("API ready.")
     yield
 
     observer.stop()
     observer.join()
+    handler.cancel()
     vectorstore = None
     llm = None
 
@@ -199,7 +276,7 @@ class QueryRequest(BaseModel):
     question: str
     release: str | None = None   # "ReleaseA" | "ReleaseB"
     doc_type: str | None = None  # "defect" | "test_execution" | "metadata" | "comparison"
-    k: int = 8
+    k: int = 5
 
 
 class SourceDocument(BaseModel):
@@ -212,6 +289,81 @@ class QueryResponse(BaseModel):
     sources: list[SourceDocument]
 
 
+# ---------------------------------------------------------------------------
+# Retrieval helpers (sync — run via asyncio.to_thread from handlers)
+# ---------------------------------------------------------------------------
+
+
+_RELEASE_RE = re.compile(r"\brelease\s*([a-z0-9]+)", re.IGNORECASE)
+
+
+def _cache_scope(question: str, search_kwargs: dict) -> str:
+    """Cache partition: filters, k, and any releases named in the question.
+
+    A cache hit returns another question's documents, so "... ReleaseA ..." and
+    "... ReleaseB ..." (cosine ~0.98 apart) must never share entries.
+    """
+    releases = sorted({m.lower() for m in _RELEASE_RE.findall(question)})
+    return json.dumps({**search_kwargs, "releases": releases}, sort_keys=True)
+
+
+def _retrieve(question: str, search_kwargs: dict) -> list[Document]:
+    """Similarity search, serving repeated / paraphrased questions from the cache."""
+    scope = _cache_scope(question, search_kwargs)
+    docs = query_cache.get_text(question, scope)
+    if docs is None:
+        query_vec = embeddings.embed_query(question)
+        docs = query_cache.get(query_vec, scope)
+        if docs is None:
+            docs = _hybrid_search(question, query_vec, search_kwargs)
+            query_cache.put(question, query_vec, scope, docs)
+    return docs
+
+
+def _hybrid_search(question: str, query_vec: list[float], search_kwargs: dict) -> list[Document]:
+    """Blend dense cosine and BM25 scores, then keep the top k.
+
+    Only dense candidates within MAX_DISTANCE are eligible; BM25 re-ranks them
+    but cannot add documents, since it matches almost any query on common
+    words.  Returns [] when nothing clears the floor.
+    """
+    if not _cosine_space:
+        # Legacy L2 collection: distances are not cosine, so neither the floor
+        # nor the blend applies — plain dense ranking until it is re-ingested.
+        return vectorstore.similarity_search_by_vector(query_vec, **search_kwargs)
+
+    k = search_kwargs["k"]
+    fetch_k = k * CANDIDATE_MULTIPLIER
+    keyword = (
+        _search_pool.submit(bm25_index.search, question, fetch_k, search_kwargs.get("filter"))
+        if bm25_index is not None else None
+    )
+    dense = vectorstore.similarity_search_by_vector_with_relevance_scores(
+        query_vec, **{**search_kwargs, "k": fetch_k},
+    )
+
+    # Collection uses cosine space, so Chroma's distance is 1 - cosine
+    dense = [(doc, distance) for doc, distance in dense if distance < MAX_DISTANCE]
+    if not dense:
+        if keyword:
+            keyword.cancel()
+        return []
+
+    scored: dict[str, list] = {}
+    for doc, distance in dense:
+        scored[doc.page_content] = [doc, DENSE_WEIGHT * (1.0 - distance)]
+    for doc, score in (keyword.result() if keyword else []):
+        if doc.page_content in scored:
+            scored[doc.page_content][1] += BM25_WEIGHT * score
+
+    ranked = sorted(scored.values(), key=lambda entry: entry[1], reverse=True)
+    return [doc for doc, _ in ranked[:k]]
+
+
+def _build_context(docs: list[Document]) -> str:
+    return "\n\n---\n\n".join([doc.page_content for doc in docs])
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -223,21 +375,28 @@ async def health():
     return {
         "status": "ok",
         "chroma_ready": vectorstore is not None,
-        "total_docs": vectorstore._collection.count() if vectorstore else 0,
+        "total_docs": _doc_count if vectorstore else 0,
         "ingest_running": _ingest_running,
         "llm_model": LLM_MODEL,
     }
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters and size of the semantic query cache."""
+    return query_cache.stats()
+
+
 @app.post("/ingest")
-async def trigger_ingest(background_tasks: BackgroundTasks):
+async def trigger_ingest(background_tasks: BackgroundTasks, refresh: bool = False):
     """
     Manually trigger re-ingestion of all documents in the docs/ folder.
     Returns immediately; ingestion runs in the background.
+    Pass refresh=true to regenerate all Q&A pairs instead of using the cache.
     """
     if _ingest_running:
         raise HTTPException(status_code=409, detail="Ingestion already in progress.")
-    background_tasks.add_task(_run_ingest)
+    background_tasks.add_task(_run_ingest, refresh)
     return {"status": "ingestion started — call GET /health to check when complete."}
 
 
@@ -249,7 +408,7 @@ async def query(request: QueryRequest):
     Optional filters (omit to search all documents):
     - release:  "ReleaseA" | "ReleaseB"
     - doc_type: "defect" | "test_execution" | "metadata" | "comparison"
-    - k:        number of documents to retrieve (default 8)
+    - k:        number of documents to retrieve (default 5)
     """
     if vectorstore is None or llm is None:
         raise HTTPException(status_code=503, detail="Service not ready.")
@@ -278,15 +437,15 @@ async def query(request: QueryRequest):
     if where:
         search_kwargs["filter"] = where
 
-    docs = vectorstore.similarity_search(request.question, **search_kwargs)
+    # Embedding + HNSW search are blocking — keep them off the event loop
+    docs = await asyncio.to_thread(_retrieve, request.question, search_kwargs)
+    if not docs:
+        # Nothing above the similarity floor — skip the Groq round-trip
+        return QueryResponse(answer=NO_RELEVANT_ANSWER, sources=[])
 
-    context = (
-        "\n\n---\n\n".join(doc.page_content for doc in docs)
-        if docs else "No relevant documents were found."
-    )
+    context = await asyncio.to_thread(_build_context, docs)
 
-    chain = PROMPT | llm | StrOutputParser()
-    answer = chain.invoke({"context": context, "question": request.question})
+    answer = await app.state.chain.ainvoke({"context": context, "question": request.question})
 
     return QueryResponse(
         answer=answer,
@@ -298,16 +457,16 @@ async def query(request: QueryRequest):
 
 
 @app.get("/debug")
-async def debug(q: str = "defect categories"):
-    """Inspect what the vectorstore retrieves for a query."""
+async def debug(q: str = "defect categories", k: int = 5):
+    """Inspect what /query retrieves (hybrid ranking + similarity floor), uncached."""
     if vectorstore is None:
         raise HTTPException(status_code=503, detail="Vectorstore not loaded.")
 
-    total = vectorstore._collection.count()
-    docs = vectorstore.similarity_search(q, k=8)
+    query_vec = await asyncio.to_thread(embeddings.embed_query, q)
+    docs = await asyncio.to_thread(_hybrid_search, q, query_vec, {"k": k})
 
     return {
-        "total_docs_in_db": total,
+        "total_docs_in_db": _doc_count,
         "query": q,
         "retrieved": [
             {"rank": i + 1, "metadata": d.metadata, "content": d.page_content}
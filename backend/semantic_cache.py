@@ -0,0 +1,125 @@
+"""
+semantic_cache.py - LSH-bucketed cache of retrieval results for /query.
+
+Repeated or paraphrased questions are common in the chat UI.  Each cached
+entry is indexed under a 16-bit random-projection signature of the query
+embedding in each of several independent hash tables.  A lookup probes the
+query's bucket plus every bucket one bit away in each table, so a
+near-duplicate whose signature differs by a sign flip or two is still found,
+then compares cosine similarity against only those candidates instead of
+re-running the Chroma search.  Exact repeats of the same question text skip
+the embedding step as well.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class SemanticCache:
+    """Thread-safe LRU cache mapping query embeddings to retrieved documents."""
+
+    def __init__(self, dim: int = 384, n_planes: int = 16, n_tables: int = 8,
+                 threshold: float = 0.95, max_entries: int = 10_000, seed: int = 0):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((n_tables, n_planes, dim))
+        self._weights = 1 << np.arange(n_planes)
+        self._flips = [0] + [1 << i for i in range(n_planes)]
+
+        # entry id -> (question, scope, bucket keys, unit vector, docs); order = LRU
+        self._entries: OrderedDict[int, tuple] = OrderedDict()
+        self._buckets: dict[tuple[int, int, str], set[int]] = {}
+        self._by_text: dict[tuple[str, str], int] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _signatures(self, vec: np.ndarray) -> list[int]:
+        """One 16-bit signature per hash table."""
+        return [int(bits) for bits in ((self._planes @ vec) > 0) @ self._weights]
+
+    def get_text(self, question: str, scope: str) -> list | None:
+        """Exact-match lookup — avoids embedding the question at all."""
+        with self._lock:
+            entry_id = self._by_text.get((question, scope))
+            if entry_id is None:
+                return None
+            self._entries.move_to_end(entry_id)
+            self.hits += 1
+            return self._entries[entry_id][4]
+
+    def get(self, embedding: list[float], scope: str) -> list | None:
+        """Return cached docs for a near-duplicate query, or None on a miss."""
+        vec = _unit(embedding)
+        signatures = self._signatures(vec)
+        with self._lock:
+            candidates: set[int] = set()
+            for table, sig in enumerate(signatures):
+                for flip in self._flips:
+                    candidates |= self._buckets.get((table, sig ^ flip, scope), set())
+
+            best_id, best_sim = None, self.threshold
+            for entry_id in candidates:
+                sim = float(self._entries[entry_id][3] @ vec)
+                if sim > best_sim:
+                    best_id, best_sim = entry_id, sim
+            if best_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            return self._entries[best_id][4]
+
+    def put(self, question: str, embedding: list[float], scope: str, docs: list) -> None:
+        vec = _unit(embedding)
+        keys = [(table, sig, scope) for table, sig in enumerate(self._signatures(vec))]
+        with self._lock:
+            if (question, scope) in self._by_text:
+                self._evict(self._by_text[(question, scope)])
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (question, scope, keys, vec, docs)
+            for key in keys:
+                self._buckets.setdefault(key, set()).add(entry_id)
+            self._by_text[(question, scope)] = entry_id
+            while len(self._entries) > self.max_entries:
+                self._evict(next(iter(self._entries)))
+
+    def _evict(self, entry_id: int) -> None:
+        question, scope, keys, _, _ = self._entries.pop(entry_id)
+        for key in keys:
+            residents = self._buckets[key]
+            residents.discard(entry_id)
+            if not residents:
+                del self._buckets[key]
+        del self._by_text[(question, scope)]
+
+    def clear(self) -> None:
+        """Drop everything — called after re-ingestion replaces the collection."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._by_text.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "buckets": len(self._buckets),
+                "max_entries": self.max_entries,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _unit(embedding: list[float]) -> np.ndarray:
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
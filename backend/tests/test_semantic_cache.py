@@ -0,0 +1,53 @@
+import numpy as np
+
+from semantic_cache import SemanticCache
+
+DIM = 384
+
+
+def _unit(vec: np.ndarray) -> np.ndarray:
+    return vec / np.linalg.norm(vec)
+
+
+def _pair(cosine: float, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Two unit vectors whose cosine similarity is exactly `cosine`."""
+    rng = np.random.default_rng(seed)
+    a = _unit(rng.standard_normal(DIM))
+    r = rng.standard_normal(DIM)
+    r = _unit(r - (r @ a) * a)
+    return a, cosine * a + np.sqrt(1 - cosine ** 2) * r
+
+
+def test_paraphrase_near_threshold_hits():
+    for seed in range(50):
+        cache = SemanticCache()
+        stored, query = _pair(0.97, seed)
+        cache.put("stored question", stored.tolist(), "scope", ["doc"])
+        assert cache.get(query.tolist(), "scope") == ["doc"]
+
+
+def test_dissimilar_query_misses():
+    cache = SemanticCache()
+    stored, query = _pair(0.80, seed=0)
+    cache.put("stored question", stored.tolist(), "scope", ["doc"])
+    assert cache.get(query.tolist(), "scope") is None
+
+
+def test_scope_isolates_entries():
+    cache = SemanticCache()
+    stored, query = _pair(0.99, seed=0)
+    cache.put("q", stored.tolist(), "releasea", ["a-doc"])
+    assert cache.get(query.tolist(), "releaseb") is None
+    assert cache.get_text("q", "releaseb") is None
+    assert cache.get_text("q", "releasea") == ["a-doc"]
+
+
+def test_lru_eviction_drops_oldest():
+    cache = SemanticCache(max_entries=2)
+    vecs = [_pair(0.0, seed)[0] for seed in range(3)]
+    for i, vec in enumerate(vecs):
+        cache.put(f"q{i}", vec.tolist(), "scope", [i])
+    assert cache.get_text("q0", "scope") is None
+    assert cache.get(vecs[0].tolist(), "scope") is None
+    assert cache.get(vecs[2].tolist(), "scope") == [2]
+    assert cache.stats()["entries"] == 2